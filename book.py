@@ -1,12 +1,19 @@
+from json import load, dump
+import re
+
+
 class Book:
     """ Represents an individual book in a Library object.
 
+    Public methods:
+    to_dict()
+
     Object attributes:
     self.author -- a book's author(s).
     self.title -- a book's title.
     self.genre -- a book's genre.
     """
-    
+
     def __init__(self, author, title, genre):
         self.author = author
         self.title = title
@@ -15,4 +22,72 @@ class Book:
 
     def __repr__(self):
         """ Enables duplicate-checking when adding or editing books. """
-        return f"{self.title}{self.author}"
\ No newline at end of file
+        return f"{self.title}{self.author}"
+
+
+    def to_dict(self):
+        """ Returns the book's details as a dictionary in the format used
+        by the JSON records.
+        """
+
+        return {
+            "Author": self.author,
+            "Title": self.title,
+            "Genre": self.genre
+        }
+
+
+def load_books(file_name):
+    """ Returns a list of Book objects loaded from the JSON records.
+    Raises FileNotFoundError if the records file does not exist.
+
+    Keyword parameters:
+    file_name -- the path of the JSON records. (required)
+    """
+
+    with open(file_name, "r") as books_json:
+        return [Book(book["Author"], book["Title"], book["Genre"])
+                for book in load(books_json)]
+
+
+def save_books(file_name, books):
+    """ Rewrites the entire JSON records with the given books. Reformats
+    the books into a list of dictionaries since the record of books is
+    kept as a list of Book objects.
+
+    Keyword parameters:
+    file_name -- the path of the JSON records. (required)
+    books -- the list of Book objects to save. (required)
+    """
+
+    with open(file_name, "w") as books_json:
+        dump([book.to_dict() for book in books], books_json, indent=4)
+
+
+def titlecase(text):
+    """ A function to better convert text to title case than .title().
+    Handles apostrophes (e.g. 's) better than .title().
+
+    Keyword parameters:
+    text -- the text to convert to title case. (required)
+
+    Explanation:
+    re.sub(pattern, substitute, input_text): Looks for pattern in
+    input_text and replaces the pattern in input_text with
+    substitute.
+
+    r"[a-zA-Z]+('[a-zA-Z]+)?": A pattern in input_text that looks
+    like "{letters}'{more letters}".
+
+    match: an object representing a pattern found in input_text.
+    match.group(): returns a string of the pattern found.
+
+    match.group()[0].upper() + match.group()[1:].lower(): ensures
+    the first character of each pattern is capital while the rest
+    of the characters are lowercase
+    """
+
+    return re.sub(r"[a-zA-Z]+('[a-zA-Z]+)?",
+                  lambda match: (match.group()[0].upper()
+                                 + match.group()[1:].lower()),
+                  text)
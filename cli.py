@@ -0,0 +1,283 @@
+""" A headless command-line interface to the library catalog. Reads and
+writes the same JSON records as the GUI without importing tkinter, so
+scripted queries (e.g. cron reports or pipelines) start quickly.
+
+Usage examples:
+python cli.py list
+python cli.py search tolkien --json
+python cli.py add "Frank Herbert" "Dune" "Science Fiction"
+python cli.py delete "Dune" --author "Frank Herbert"
+python cli.py stats
+python cli.py export --format csv -o books.csv
+
+Book records are loaded, saved and formatted by the helpers in book.py,
+shared with the GUI. Modules only needed by some commands (csv, argparse,
+collections) are imported inside the functions that use them to keep
+start-up time low.
+"""
+
+import sys
+from json import dump, dumps
+from os.path import dirname, join
+from book import Book, load_books, save_books, titlecase
+
+
+# The same records file used by the Library class.
+DEFAULT_FILE = join(dirname(__file__), "library_books.json")
+FIELDS = ("Author", "Title", "Genre")
+
+
+def read_books(file_name):
+    """ Returns the books in the JSON records, or an empty list if the
+    records file does not exist yet.
+
+    Keyword parameters:
+    file_name -- the path of the JSON records. (required)
+    """
+
+    try:
+        return load_books(file_name)
+    except FileNotFoundError:
+        return []
+
+
+def write_books(books, as_json=False, out=None):
+    """ Streams books to out (default: the current sys.stdout) one line at
+    a time. Writes one JSON object per line (JSON Lines) if as_json is
+    True, otherwise tab-separated author, title and genre in title case.
+    Returns the number of books written.
+    """
+
+    out = out if out is not None else sys.stdout
+
+    count = 0
+    for book in books:
+        if as_json:
+            out.write(dumps(book.to_dict()) + "\n")
+        else:
+            out.write("\t".join((titlecase(book.author),
+                                 titlecase(book.title),
+                                 titlecase(book.genre))) + "\n")
+        count += 1
+
+    return count
+
+
+def cmd_list(args):
+    """ Lists every book, optionally only those of a given genre. """
+
+    books = read_books(args.file)
+    if args.genre:
+        genre = args.genre.strip().upper()
+        books = (book for book in books if book.genre == genre)
+
+    write_books(books, args.json)
+    return 0
+
+
+def cmd_search(args):
+    """ Lists books whose author or title contains the search value,
+    matching Library.search(). Returns 1 if nothing was found.
+    """
+
+    search_value = args.value.strip().upper()
+    books = (book for book in read_books(args.file)
+             if search_value in book.author or search_value in book.title)
+
+    if not write_books(books, args.json):
+        print("No search results found.", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_add(args):
+    """ Adds a book, applying the same checks as AddDialog.on_ok(). """
+
+    author = args.author.strip()
+    title = args.title.strip()
+    genre = args.genre.strip()
+
+    if not author or not title or not genre:
+        print("Please fill all fields.", file=sys.stderr)
+        return 1
+
+    books = read_books(args.file)
+    new_book = Book(author.upper(), title.upper(), genre.upper())
+
+    if repr(new_book) in [repr(book) for book in books]:
+        print("This book has already been added.", file=sys.stderr)
+        return 1
+
+    books.append(new_book)
+    save_books(args.file, books)
+    write_books([new_book], args.json)
+    return 0
+
+
+def cmd_delete(args):
+    """ Deletes the book with the given title, optionally only the one by
+    the given author. Returns 1 if no book matched, or if several books
+    matched without --author or --all.
+    """
+
+    title = args.title.strip().upper()
+    author = args.author.strip().upper() if args.author else None
+
+    books = read_books(args.file)
+    kept, deleted = [], []
+    for book in books:
+        if book.title == title and (author is None or book.author == author):
+            deleted.append(book)
+        else:
+            kept.append(book)
+
+    if not deleted:
+        print("No matching books found.", file=sys.stderr)
+        return 1
+
+    # Like the GUI, only delete what the user asked for: several books
+    # sharing a title need --author or an explicit --all.
+    if len(deleted) > 1 and author is None and not args.all:
+        write_books(deleted, out=sys.stderr)
+        print("Several books match. Use --author to pick one or --all to "
+              "delete them all.", file=sys.stderr)
+        return 1
+
+    save_books(args.file, kept)
+    write_books(deleted, args.json)
+    return 0
+
+
+def cmd_stats(args):
+    """ Prints the total number of books and the number of books per
+    genre, most common first.
+    """
+
+    from collections import Counter
+
+    books = read_books(args.file)
+    genres = Counter(book.genre for book in books).most_common()
+
+    if args.json:
+        print(dumps({"Total": len(books), "Genres": dict(genres)}))
+    else:
+        print(f"Total\t{len(books)}")
+        for genre, count in genres:
+            print(f"{titlecase(genre)}\t{count}")
+    return 0
+
+
+def cmd_export(args):
+    """ Writes every book to a file or stdout as CSV or JSON. """
+
+    books = read_books(args.file)
+    out = open(args.output, "w", newline="") if args.output else sys.stdout
+
+    try:
+        if args.format == "csv":
+            from csv import DictWriter
+            writer = DictWriter(out, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(book.to_dict() for book in books)
+        else:
+            dump([book.to_dict() for book in books], out, indent=4)
+            out.write("\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def build_parser():
+    """ Returns the argparse parser for all CLI commands. """
+
+    from argparse import ArgumentParser
+
+    # Options shared by every command, accepted after the command name.
+    common = ArgumentParser(add_help=False)
+    common.add_argument(
+        "-f", "--file", default=DEFAULT_FILE,
+        help="path to the JSON records (default: library_books.json)")
+
+    # Export picks its output type with --format instead.
+    output = ArgumentParser(add_help=False)
+    output.add_argument(
+        "--json", action="store_true",
+        help="print results as JSON (one object per line for book lists)")
+
+    parser = ArgumentParser(
+        description="Query and edit the library catalog without the GUI.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser(
+        "list", parents=[common, output], help="list all books")
+    list_parser.add_argument("--genre", help="only list books of this genre")
+    list_parser.set_defaults(func=cmd_list)
+
+    search_parser = commands.add_parser(
+        "search", parents=[common, output],
+        help="search book authors and titles")
+    search_parser.add_argument("value", help="the text to search for")
+    search_parser.set_defaults(func=cmd_search)
+
+    add_parser = commands.add_parser(
+        "add", parents=[common, output], help="add a book")
+    add_parser.add_argument("author")
+    add_parser.add_argument("title")
+    add_parser.add_argument("genre")
+    add_parser.set_defaults(func=cmd_add)
+
+    delete_parser = commands.add_parser(
+        "delete", parents=[common, output], help="delete books by title")
+    delete_parser.add_argument("title")
+    delete_parser.add_argument(
+        "--author", help="only delete the book by this author")
+    delete_parser.add_argument(
+        "--all", action="store_true",
+        help="delete every book with this title")
+    delete_parser.set_defaults(func=cmd_delete)
+
+    stats_parser = commands.add_parser(
+        "stats", parents=[common, output],
+        help="count books in total and by genre")
+    stats_parser.set_defaults(func=cmd_stats)
+
+    export_parser = commands.add_parser(
+        "export", parents=[common], help="export all books as CSV or JSON")
+    export_parser.add_argument(
+        "--format", choices=("csv", "json"), default="csv")
+    export_parser.add_argument(
+        "-o", "--output", help="file to write to (default: stdout)")
+    export_parser.set_defaults(func=cmd_export)
+
+    return parser
+
+
+def main(argv=None):
+    """ Parses the command-line arguments and runs the chosen command.
+    Returns the exit status. Errors reading or writing files are printed
+    as a single line to stderr with exit status 1.
+    """
+
+    args = build_parser().parse_args(argv)
+
+    try:
+        return args.func(args)
+    except BrokenPipeError:
+        # The reader of a pipe (e.g. head) closed early.
+        sys.stderr.close()
+        return 0
+
+    # Unreadable/unwritable files, e.g. a missing export directory.
+    except OSError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    # Records that are not valid JSON or are missing a field.
+    except (ValueError, KeyError, TypeError) as e:
+        print(f"Invalid records in '{args.file}': {e!r}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
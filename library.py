@@ -1,5 +1,4 @@
-from book import Book
-from json import load, dump
+from book import load_books, save_books
 from contextlib import chdir
 from os.path import dirname
 from tkinter import *
@@ -44,10 +43,7 @@ class Library:
         # To ensure that the correct directory is used for Linux
         with chdir(dirname(__file__)):
             try:
-                    with open(self.file_name, "r+") as books_json:
-                        for book in load(books_json):
-                            self.books.append(Book(
-                                book["Author"], book["Title"], book["Genre"]))
+                self.books = load_books(self.file_name)
 
             # If the specified file of the library records does not exist,
             # create a new JSON file with the same name then open it.
@@ -165,27 +161,14 @@ class Library:
 
     def save(self):
         """ Handles updating the JSON records. Called whenever the GUI
-        application is closed. Reformats the record of books into a list
-        with multiple dictionaries since the record of books was created
-        as a list of Book objects.
+        application is closed. The records are written by save_books()
+        in book.py, which is shared with the command-line interface.
         """
 
-        save_file = []
-
-        for book in self.books:
-            save_file.append(
-                {
-                    "Author": book.author,
-                    "Title": book.title,
-                    "Genre": book.genre
-                }
-            )
-
         # To ensure that the correct directory is used for Linux
         with chdir(dirname(__file__)):
             # Rewrites the entire JSON file with the latest records.
-            with open(self.file_name, "w") as books_json:
-                dump(save_file, books_json, indent=4)
+            save_books(self.file_name, self.books)
 
 
     def edit(self, index, iid):
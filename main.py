@@ -1,7 +1,7 @@
 from tkinter import *
 from tkinter import ttk
 from library import Library
-import re
+from book import titlecase
 
 
 class Main:
@@ -225,32 +225,13 @@ class Main:
 
     @staticmethod
     def titlecase(text):
-        """ A function to better convert text to title case than .title().
-        Handles apostrophes (e.g. 's) better than .title().
+        """ Converts text to title case. See titlecase() in book.py.
 
         Keyword parameters:
         text -- the text to convert to title case. (required)
-
-        Explanation:
-        re.sub(pattern, substitute, input_text): Looks for pattern in 
-        input_text and replaces the pattern in input_text with 
-        substitute.
-        
-        r"[a-zA-Z]+('[a-zA-Z]+)?": A pattern in input_text that looks
-        like "{letters}'{more letters}".
-        
-        match: an object representing a pattern found in input_text.
-        match.group(): returns a string of the pattern found.
-        
-        match.group()[0].upper() + match.group()[1:].lower(): ensures
-        the first character of each pattern is capital while the rest
-        of the characters are lowercase
         """
-        
-        return re.sub(r"[a-zA-Z]+('[a-zA-Z]+)?", 
-                      lambda match: (match.group()[0].upper() 
-                                     + match.group()[1:].lower()), 
-                      text)
+
+        return titlecase(text)
 
 
 Main()
\ No newline at end of file